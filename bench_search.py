@@ -0,0 +1,85 @@
+"""
+Benchmark latensi /search dengan data banyak user di SQLite (FTS5).
+
+    python bench_search.py                          # 50 user x 10.000 pesan
+    python bench_search.py --users 100 --messages 10000
+
+Database dibuat di direktori sementara. Data diisi lewat update_search_index (jalur yang
+sama dengan /save_session), lalu query dijalankan untuk satu user. Hasil: median dan p95 (ms).
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+MESSAGES_PER_SESSION = 50
+WORDS_PER_MESSAGE = 30
+
+def build_vocabulary(size=5000):
+    rng = random.Random(42)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    return [''.join(rng.choice(letters) for _ in range(rng.randint(4, 9))) for _ in range(size)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--messages', type=int, default=10000, help='Jumlah pesan per user')
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix='sparq_bench_')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app as sparq
+
+    flask_app = sparq.create_app()
+    vocabulary = build_vocabulary()
+    # Sebagian kecil kata sangat umum supaya ada query yang cocok dengan hampir semua pesan
+    common = vocabulary[:20]
+    rng = random.Random(1)
+
+    with flask_app.app_context():
+        sparq.init_db()
+        t = time.perf_counter()
+        for uid in range(1, args.users + 1):
+            sparq.db.session.add(sparq.User(id=uid, username=f'user{uid}', email=f'user{uid}@sparq.dev', password_hash='-'))
+            for n in range(args.messages // MESSAGES_PER_SESSION):
+                messages = [{'text': ' '.join(rng.choice(common) if rng.random() < 0.2 else rng.choice(vocabulary)
+                                              for _ in range(WORDS_PER_MESSAGE)), 'isUser': i % 2 == 0}
+                            for i in range(MESSAGES_PER_SESSION)]
+                chat_session = sparq.ChatSession(id=f'u{uid}s{n}', user_id=uid, title=f'Chat {rng.choice(vocabulary)}',
+                                                 messages=json.dumps(messages), history='[]')
+                sparq.db.session.add(chat_session)
+                sparq.update_search_index(chat_session)
+            sparq.db.session.commit()
+        rows = sparq.db.session.execute(sparq.text("SELECT COUNT(*) FROM chat_search")).scalar()
+        print(f"[BENCH] {rows} baris index ({args.users} user) dibuat dalam {time.perf_counter() - t:.1f}s")
+
+        queries = {
+            'kata umum': common[0],
+            'dua kata umum': f'{common[1]} {common[2]}',
+            'kata jarang': vocabulary[4000],
+            'prefix': vocabulary[3000][:3],
+        }
+        results = {}
+        for name, query in queries.items():
+            times = []
+            for _ in range(args.runs):
+                t = time.perf_counter()
+                found = sparq.search_sessions(1, query, 21, 0)
+                times.append((time.perf_counter() - t) * 1000)
+            times.sort()
+            results[name] = {
+                'query': query,
+                'hasil': len(found),
+                'median_ms': round(statistics.median(times), 1),
+                'p95_ms': round(times[int(len(times) * 0.95) - 1], 1),
+            }
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
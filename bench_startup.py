@@ -0,0 +1,95 @@
+"""
+Benchmark waktu import + create_app() dan RSS dalam satu proses.
+
+Ini bukan pengukuran boot worker gunicorn --preload. Skenario "boot + first model use"
+menunjukkan memori yang tetap dibayar tiap worker saat SDK Gemini dimuat pada request pertama.
+
+    python bench_startup.py                 # tree saat ini
+    python bench_startup.py --before HEAD~1 # bandingkan dengan app.py dari revisi git lain
+
+Setiap skenario dijalankan di proses baru supaya cache import tidak tercampur.
+Hasil: waktu import + pembuatan app (ms) dan max RSS (MB), median dari --runs kali.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Tree saat ini: import app tidak punya efek samping, app dibuat lewat factory
+AFTER_CODE = """
+import time, resource
+t = time.perf_counter()
+import app
+app.create_app()
+elapsed = time.perf_counter() - t
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+# Sama seperti AFTER_CODE, ditambah biaya import SDK model saat request pertama
+AFTER_FIRST_USE_CODE = """
+import time, resource
+t = time.perf_counter()
+import app
+app.create_app()
+app.get_genai()
+elapsed = time.perf_counter() - t
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+# Revisi lama: app, engine, dan SDK dibuat saat import modul
+BEFORE_CODE = """
+import time, resource
+t = time.perf_counter()
+import app
+elapsed = time.perf_counter() - t
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+def run_scenario(code, cwd, runs):
+    times, rss = [], []
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, '-c', code], cwd=cwd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            return {'error': proc.stderr.strip().splitlines()[-1]}
+        elapsed, maxrss = proc.stdout.strip().splitlines()[-1].split()
+        times.append(float(elapsed) * 1000)
+        rss.append(int(maxrss) / 1024)  # ru_maxrss dalam KB di Linux
+    return {'boot_ms': round(statistics.median(times), 1), 'rss_mb': round(statistics.median(rss), 1)}
+
+def checkout_app(rev):
+    """Salin app.py dari revisi git ke direktori sementara"""
+    tmp = tempfile.mkdtemp(prefix='sparq_bench_')
+    source = subprocess.run(
+        ['git', 'show', f'{rev}:app.py'], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    with open(os.path.join(tmp, 'app.py'), 'w') as f:
+        f.write(source)
+    return tmp
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--before', help='Revisi git pembanding (mis. HEAD~1)')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    results = {}
+    if args.before:
+        tmp = checkout_app(args.before)
+        try:
+            results[f'before ({args.before})'] = run_scenario(BEFORE_CODE, tmp, args.runs)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    results['after (boot)'] = run_scenario(AFTER_CODE, ROOT, args.runs)
+    results['after (boot + first model use)'] = run_scenario(AFTER_FIRST_USE_CODE, ROOT, args.runs)
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Stub upstream lokal untuk menguji timeout, retry, hedging dan circuit breaker
+tanpa memanggil Gemini API.
+
+Aktifkan lewat environment variable UPSTREAM_STUB, contoh:
+    UPSTREAM_STUB="error_rate=0.3,stall_rate=0.2,stall=60,fail_models=gemini-2.0-flash-exp"
+
+Seperti send_message(stream=True) di SDK, open_stream baru kembali setelah chunk pertama
+tersedia, jadi jeda dan error sebelum token pertama terjadi sebelum fungsi ini kembali.
+
+Opsi:
+    first_token_delay  detik sebelum token pertama (default 0)
+    error_rate         peluang request gagal sementara (ConnectionError, di-retry)
+    rejected_rate      peluang request ditolak permanen (ValueError, tidak di-retry)
+    stall_rate         peluang macet sebelum token pertama (default 0)
+    stall              lama macet dalam detik (default 60)
+    mid_error_rate     peluang stream putus setelah token pertama (default 0)
+    token_delay        jeda antar chunk dalam detik (default 0.05)
+    fail_models        daftar model (dipisah '|') yang selalu gagal
+"""
+import random
+import time
+
+DEFAULTS = {
+    'first_token_delay': 0.0,
+    'error_rate': 0.0,
+    'rejected_rate': 0.0,
+    'stall_rate': 0.0,
+    'stall': 60.0,
+    'mid_error_rate': 0.0,
+    'token_delay': 0.05,
+}
+
+class StubChunk:
+    def __init__(self, text):
+        self.text = text
+
+def parse_spec(spec):
+    options = dict(DEFAULTS)
+    options['fail_models'] = []
+    for item in spec.split(','):
+        if '=' not in item:
+            continue
+        key, value = (part.strip() for part in item.split('=', 1))
+        if key == 'fail_models':
+            options['fail_models'] = [m for m in value.split('|') if m]
+        elif key in DEFAULTS:
+            options[key] = float(value)
+    return options
+
+def open_stream(spec, model_name, history, message):
+    """Tiru chat.send_message(..., stream=True): blok sampai token pertama, lalu kembalikan iterator chunk"""
+    options = parse_spec(spec)
+    
+    time.sleep(options['first_token_delay'])
+    if random.random() < options['stall_rate']:
+        time.sleep(options['stall'])
+    if model_name in options['fail_models'] or random.random() < options['error_rate']:
+        raise ConnectionError(f"[STUB] Upstream error ({model_name})")
+    if random.random() < options['rejected_rate']:
+        raise ValueError("[STUB] Prompt diblokir")
+    
+    words = f"[{model_name}] Balasan stub untuk: {message}".split(' ')
+    
+    def generate():
+        yield StubChunk(words[0])
+        for word in words[1:]:
+            if random.random() < options['mid_error_rate']:
+                raise ConnectionError("[STUB] Stream terputus")
+            time.sleep(options['token_delay'])
+            yield StubChunk(' ' + word)
+    
+    return generate()
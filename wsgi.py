@@ -0,0 +1,4 @@
+# Entry point WSGI (gunicorn / PythonAnywhere): gunicorn --preload wsgi:app
+from app import create_app
+
+app = create_app()